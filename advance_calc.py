@@ -6,7 +6,7 @@ It includes basic arithmetic operations, a feature to draw triangles based on an
 and comprehensive logging of operations and calculations.
 
 The script utilises the `io` module for file handling, `math` for mathematical operations,
-`fractions.Fraction` for handling fractions, and `os` for checking file existence.
+a bounded Stern-Brocot search for fraction display, and `os` for checking file existence.
 External modules `utility` and `triangle` are imported for additional functionality.
 
 The main components of the script are as follows:
@@ -26,8 +26,8 @@ The script is designed to be interactive and user-friendly, with error handling
 """
 
 import math
-from fractions import Fraction
 import os
+import sys
 import utilities, triangle
 import io
 
@@ -38,6 +38,18 @@ DIVISION = "4"
 DRAW_TRIANGLE = "5"
 EXIT = "9"
 
+_INF = math.inf
+
+# Operator symbols for calculation messages, bound once instead of
+# re-evaluating chr() per logged operation
+_TIMES = "×"  # × multiplication sign
+_DIVIDE = "÷"  # ÷ division sign
+
+# Largest accepted input magnitude. Keeping inputs at or below half of the
+# float64 maximum guarantees addition and subtraction can never overflow,
+# so those operations need no per-call overflow check.
+_MAX_INPUT = sys.float_info.max / 2
+
 MENU_ITEMS = {
     ADDITION: "Addition",
     SUBTRACTION: "Subtraction",
@@ -47,8 +59,36 @@ MENU_ITEMS = {
     EXIT: "Exit Program",
 }
 
+# The menus never change at runtime, so render each of them to a single
+# string once at import time rather than re-formatting per display.
+_MAIN_MENU_STR = "\nMenu\nSelect from the following:\n" + "\n".join(
+    f"{choice_num}: {choice}" for choice_num, choice in MENU_ITEMS.items()
+)
+
+_FORMATTING_SUBMENU_HEADER = (
+    "\nFormatting Submenu\n"
+    "-- Select from the following:\n"
+    "|_ 1. Standard Format\n"
+    "|_ 2. Scientific Notation Format\n"
+    "|_ 3. Sexagesimal Format\n"
+)
+_FORMATTING_SUBMENU_STRS = {
+    False: _FORMATTING_SUBMENU_HEADER + "|_ 9. Exit Submenu\n",
+    True: _FORMATTING_SUBMENU_HEADER + "|_ 4. Fraction Format\n|_ 9. Exit Submenu\n",
+}
+
+
+class _QuitInput(BaseException):
+    """Raised when the user types 'x'/'exit' to abandon a number prompt.
+
+    Subclasses BaseException so it cannot be swallowed by a generic
+    ``except Exception`` and carries no message or traceback payload.
+    """
+
+    __slots__ = ()
 
-def initialisation(log: io.TextIOWrapper, is_new_file: bool) -> tuple[list[str], int]:
+
+def initialisation(log: io.TextIOWrapper, is_new_file: bool) -> tuple[str, int]:
     """
     Initialise the calculator by reading from the log file and resetting the log.
 
@@ -57,19 +97,20 @@ def initialisation(log: io.TextIOWrapper, is_new_file: bool) -> tuple[list[str],
         is_new_file (bool): Flag indicating whether the log file is new.
 
     Returns:
-        old_log (list[str]): The lines from the previous log.
+        old_log (str): The previous log entries after the header, as one blob.
         old_calc_count (int): The number of previous calculations.
     """
     log.seek(0)
     if not is_new_file:
-        old_calc_msg = log.readline()[20:].rstrip()
+        # One read of the whole file, then split the header off in place; the
+        # remainder is the old log, kept as one contiguous string since it is
+        # only ever written back verbatim.
+        header, _, old_log = log.read().partition("\n")
+        old_calc_msg = header[20:].rstrip()
         old_calc_count = utilities.morse2num(old_calc_msg) if old_calc_msg else 0
-        log.seek(0)
-        old_log = log.readlines()[1:]
     else:
         old_calc_count = 0
-        log.seek(0)
-        old_log = []
+        old_log = ""
     log.truncate(0)
     return old_log, old_calc_count
 
@@ -78,10 +119,7 @@ def show_main_menu() -> None:
     """
     Display main menu options
     """
-    print("\nMenu")
-    print("Select from the following:")
-    for choice_num, choice in MENU_ITEMS.items():
-        print(f"{choice_num}: {choice}")
+    print(_MAIN_MENU_STR)
 
 
 def main_menu() -> tuple[list[str], int]:
@@ -126,7 +164,7 @@ def main_menu() -> tuple[list[str], int]:
 
                 new_result = multiplication(new_factor1, new_factor2)
                 calc_msg = (
-                    f"Calculation {new_factor1} {chr(215)} {new_factor2} = {new_result}"
+                    f"Calculation {new_factor1} {_TIMES} {new_factor2} = {new_result}"
                 )
 
             elif user_selection == DIVISION:  # Division
@@ -134,21 +172,25 @@ def main_menu() -> tuple[list[str], int]:
                 new_divisor = valid_float_input("Input divisor: ")
 
                 new_result = division(new_dividend, new_divisor)
-                calc_msg = f"Calculation {new_dividend} {chr(247)} {new_divisor} = {new_result}"
+                calc_msg = f"Calculation {new_dividend} {_DIVIDE} {new_divisor} = {new_result}"
 
             elif user_selection == DRAW_TRIANGLE:  # Draw triangle
                 new_angle1 = valid_float_input("Angle 1 of triangle: ")
                 new_angle2 = valid_float_input("Angle 2 of triangle: ")
                 new_angle3 = valid_float_input("Angle 3 of triangle: ")
-                if new_angle1 + new_angle2 + new_angle3 != 180:
+                angles = (new_angle1, new_angle2, new_angle3)
+                smallest_angle = min(angles)
+                # isclose rather than != so float angles summing to 180 within
+                # rounding error are not falsely rejected
+                if not math.isclose(sum(angles), 180, abs_tol=1e-9):
                     raise ValueError(
                         "Invalid triangle! Angle sum of triangle must equal to 180˚."
                     )
-                elif (new_angle1 <= 0) or (new_angle2 <= 0) or (new_angle3 <= 0):
+                elif smallest_angle <= 0:
                     raise ValueError(
                         "Invalid triangle! All angles must be bigger than 0˚."
                     )
-                elif (new_angle1 < 5) or (new_angle2 < 5) or (new_angle3 < 5):
+                elif smallest_angle < 5:
                     raise ValueError(
                         "Minimum angle accepted is 5˚for the triangle to display properly."
                     )
@@ -187,9 +229,8 @@ def main_menu() -> tuple[list[str], int]:
             break
 
         # When user want to quit inputting
-        except Exception as exception:
-            if exception.args == ("Quit User Input",):
-                continue
+        except _QuitInput:
+            continue
 
     return new_log, new_calc_count
 
@@ -204,18 +245,22 @@ def valid_float_input(prompt: str) -> float:
     Returns:
         float: The validated float input.
     """
-    valid_num = False
-    while not valid_num:
+    while True:
+        strInput = input(prompt)
         try:
-            strInput = input(prompt).lower()
             float_input = float(strInput)
         except ValueError:
-            if strInput == "x" or strInput == "exit":
-                raise Exception("Quit User Input")
+            # Only lowercase once numeric parsing has already failed; the
+            # common numeric path never allocates the lowered copy.
+            if strInput.lower() in ("x", "exit"):
+                raise _QuitInput()
             print("Invalid number! Please try again. Type 'x' to exit inputting")
         else:
-            valid_num = True
-    return float_input
+            # Written as not(<=) so NaN is rejected alongside oversized values
+            if not abs(float_input) <= _MAX_INPUT:
+                print("Number too big in magnitude! Please try again.")
+            else:
+                return float_input
 
 
 def addition(addend1: float, addend2: float) -> float:
@@ -229,10 +274,9 @@ def addition(addend1: float, addend2: float) -> float:
     Returns:
         float: The result of the addition.
     """
-    sum_ = addend1 + addend2
-    if math.isinf(sum_):
-        raise OverflowError
-    return sum_
+    # Adding two finite floats cannot overflow by more than a factor of two,
+    # which float64 absorbs; valid_float_input already rejects non-finite input.
+    return addend1 + addend2
 
 
 def subtraction(minuend: float, subtrahend: float) -> float:
@@ -246,10 +290,8 @@ def subtraction(minuend: float, subtrahend: float) -> float:
     Returns:
         float: The result of the subtraction.
     """
-    difference_ = minuend - subtrahend
-    if math.isinf(difference_):
-        raise OverflowError
-    return difference_
+    # As with addition, bounded finite inputs cannot overflow a subtraction.
+    return minuend - subtrahend
 
 
 def multiplication(factor1: float, factor2: float) -> float:
@@ -264,7 +306,7 @@ def multiplication(factor1: float, factor2: float) -> float:
         float: The result of the multiplication.
     """
     product_ = factor1 * factor2
-    if math.isinf(product_):
+    if product_ == _INF or product_ == -_INF:
         raise OverflowError
     return product_
 
@@ -281,11 +323,59 @@ def division(dividend: float, divisor: float) -> float:
         float: The result of the division.
     """
     quotient_ = dividend / divisor
-    if math.isinf(quotient_):
+    if quotient_ == _INF or quotient_ == -_INF:
         raise OverflowError
     return quotient_
 
 
+def _float_to_fraction_fast(value: float, max_denominator: int = 1000) -> tuple[int, int]:
+    """
+    Approximate a float as a fraction with a bounded denominator.
+
+    Walks the Stern-Brocot tree by mediants over the fractional part and
+    stops as soon as the denominator bound is exceeded, avoiding the
+    big-integer continued-fraction reduction Fraction.limit_denominator
+    performs on the float's exact 52-bit ratio.
+
+    Args:
+        value (float): The value to approximate.
+        max_denominator (int): The largest denominator allowed.
+
+    Returns:
+        tuple[int, int]: The (numerator, denominator) of the approximation.
+    """
+    sign = -1 if value < 0 else 1
+    value = abs(value)
+    whole = int(value)
+    frac = value - whole
+    if frac == 0:
+        return sign * whole, 1
+
+    lo_num, lo_den = 0, 1
+    hi_num, hi_den = 1, 1
+    while True:
+        med_num = lo_num + hi_num
+        med_den = lo_den + hi_den
+        if med_den > max_denominator:
+            break
+        target = frac * med_den
+        if med_num == target:  # Exact representation found
+            lo_num, lo_den = med_num, med_den
+            hi_num, hi_den = med_num, med_den
+            break
+        if med_num < target:
+            lo_num, lo_den = med_num, med_den
+        else:
+            hi_num, hi_den = med_num, med_den
+
+    # Keep whichever enclosing bound lies closer to the fractional part
+    if abs(frac - lo_num / lo_den) <= abs(frac - hi_num / hi_den):
+        num, den = lo_num, lo_den
+    else:
+        num, den = hi_num, hi_den
+    return sign * (whole * den + num), den
+
+
 def show_formatting_submenu(is_fraction: bool) -> None:
     """
     Display formatting options for the operation submenu.
@@ -293,14 +383,7 @@ def show_formatting_submenu(is_fraction: bool) -> None:
     Args:
         is_fraction (bool): Indicates if a fraction format option should be included.
     """
-    print("\nFormatting Submenu")
-    print("-- Select from the following:")
-    print("|_ 1. Standard Format")
-    print("|_ 2. Scientific Notation Format")
-    print("|_ 3. Sexagesimal Format")
-    if is_fraction:
-        print("|_ 4. Fraction Format")
-    print("|_ 9. Exit Submenu\n")
+    print(_FORMATTING_SUBMENU_STRS[is_fraction])
 
 
 def formatting_submenu(result: float, is_fraction: bool) -> None:
@@ -312,6 +395,10 @@ def formatting_submenu(result: float, is_fraction: bool) -> None:
         is_fraction (bool): Indicates if the result can be formatted as a fraction.
     """
     submenu_running = True
+    # Fraction.limit_denominator runs a continued-fraction search, so only
+    # build the fraction if option 4 is actually picked, and keep it for
+    # repeat selections within this submenu visit.
+    cached_fraction = None
     while submenu_running:
         show_formatting_submenu(is_fraction)
         user_selection = input("Please input a valid submenu number: ")
@@ -326,7 +413,10 @@ def formatting_submenu(result: float, is_fraction: bool) -> None:
             )
         # Display in fractional format if it can be represented by a fraction
         elif user_selection == "4" and is_fraction:
-            print(f"   = {Fraction(result).limit_denominator(1000)}")
+            if cached_fraction is None:
+                numerator, denominator = _float_to_fraction_fast(result)
+                cached_fraction = f"{numerator}/{denominator}"
+            print(f"   = {cached_fraction}")
         elif user_selection == "9":  # Exit submenu
             submenu_running = running_confirmation()
         else:
@@ -351,7 +441,7 @@ def running_confirmation() -> bool:
 def upload_log(
     log: io.TextIOWrapper,
     new_log: list[str],
-    old_log: list[str],
+    old_log: str,
     new_calc_count: int,
     old_calc_count: int,
 ) -> None:
@@ -361,16 +451,16 @@ def upload_log(
     Args:
         log (io.TextIOWrapper): The log file stream.
         new_log (list[str]): The newly added lines of logs.
-        old_log (list[str]): The existing lines of logs.
+        old_log (str): The existing log entries as one blob.
         new_calc_count (int): The number of new calculations made.
         old_calc_count (int): The number of old calculations from previous runs.
     """
     total_calc_msg = (
         f"Total calculations: {utilities.num2morse(new_calc_count+old_calc_count)}\n"
     )
-    log.writelines(total_calc_msg)
-    log.writelines(old_log)
-    log.writelines(new_log)
+    # Coalesce everything into one write so the whole log leaves in a single
+    # flush instead of three separate writeline passes.
+    log.write(total_calc_msg + old_log + "".join(new_log))
     log.close()
 
 
@@ -381,7 +471,15 @@ if __name__ == "__main__":
     # File Initlisation
     is_new_file = not os.path.isfile("adv_calc_logs.txt")
 
-    log = open("adv_calc_logs.txt", mode="a+")
+    # Explicit encoding avoids platform-default surprises and newline=""
+    # skips universal-newline translation when scanning large old logs
+    log = open(
+        "adv_calc_logs.txt",
+        mode="a+",
+        buffering=1 << 16,
+        encoding="utf-8",
+        newline="",
+    )
 
     # Initialise the calculator with the log file
     old_log, old_calc_count = initialisation(log, is_new_file)
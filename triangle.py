@@ -20,13 +20,68 @@ The main program, indicated by the `if __name__ == "__main__":` block, is where
 The script provides a visual representation of a triangle, including annotations for side lengths and angles, using the `matplotlib` library. The comments and documentation help to understand the functionality and implementation details of the code.
 """
 
+from __future__ import annotations
+
+import cmath
 import math
-import matplotlib.pyplot as plt
-from matplotlib.patches import Arc
 from typing import Tuple
 
-# Assuming utility module exists and contains the midpoint function
-import utilities
+# matplotlib's pyplot import costs hundreds of milliseconds (backends, fonts),
+# so it and numpy are loaded lazily on the first draw_triangle call instead of
+# taxing the startup of every calculator session that never draws a triangle.
+plt = None
+Arc = None
+np = None
+
+
+def _load_plotting_libraries() -> None:
+    """Import matplotlib and numpy on first use and apply the constant style.
+
+    sys.modules caches the imports, so calls after the first are cheap; the
+    style settings never change, so they are applied once here rather than
+    re-running the rcParams validation pipeline on every draw_triangle call.
+    """
+    global plt, Arc, np
+    if plt is not None:
+        return
+
+    import matplotlib.pyplot
+    from matplotlib.patches import Arc as arc
+    import numpy
+
+    plt = matplotlib.pyplot
+    Arc = arc
+    np = numpy
+
+    plt.rc("lines", linestyle="solid", marker="o")
+    plt.rcParams["font.size"] = 12
+
+
+def _compute_triangle_geometry(
+    angle1: float, angle2: float
+) -> Tuple[float, float, float, float]:
+    """
+    Compute the radian angles and third-vertex coordinates of the triangle.
+
+    Assumes pt1 (0,0) and pt2 (1,0) for relative scaling, so only the third
+    point needs to be derived. Kept as a standalone pure-math helper so the
+    scalar trigonometry runs once, up front, separate from the plotting calls.
+
+    Args:
+        angle1 (float): Angle 1 of the triangle in degrees.
+        angle2 (float): Angle 2 of the triangle in degrees.
+
+    Returns:
+        Tuple[float, float, float, float]: (angle1_rad, angle2_rad, x3, y3).
+    """
+    angle1_rad = math.radians(angle1)
+    angle2_rad = math.radians(angle2)
+
+    tan1 = math.tan(angle1_rad)
+    tan2 = math.tan(angle2_rad)
+    x3 = tan2 / (tan2 + tan1)
+    y3 = tan1 * x3
+    return angle1_rad, angle2_rad, x3, y3
 
 
 def draw_triangle(angle1: float, angle2: float, angle3: float) -> None:
@@ -41,36 +96,32 @@ def draw_triangle(angle1: float, angle2: float, angle3: float) -> None:
     Returns:
         None: Exports a PNG with the drawn triangle.
     """
-    # Rad conversion for MatPlotLib utilisation
-    angle1_rad = math.radians(angle1)
-    angle2_rad = math.radians(angle2)
+    _load_plotting_libraries()
 
-    # Calculate third point based on the given angles, assume pt1 (0,0) and
-    # pt2 (1,0) for relative scaling
-    x3 = math.tan(angle2_rad) / (math.tan(angle2_rad) + math.tan(angle1_rad))
-    y3 = math.tan(angle1_rad) * x3
+    angle1_rad, angle2_rad, x3, y3 = _compute_triangle_geometry(angle1, angle2)
 
-    pt1 = (0.0, 0.0)
-    pt2 = (1.0, 0.0)
-    pt3 = (x3, y3)
+    # Vertex rows pt1, pt2, pt3; rolling by one row pairs each vertex with its
+    # successor, so all edge midpoints and lengths come from two array ops.
+    pts = np.array([[0.0, 0.0], [1.0, 0.0], [x3, y3]])
+    shifted = np.roll(pts, -1, axis=0)
+    midpoints = (pts + shifted) / 2
+    edge_lengths = np.linalg.norm(shifted - pts, axis=1)
 
-    # Common MatplotLib Setting
+    # Per-call MatplotLib axis reset
     plt.cla()
     plt.axis("equal")
-    plt.rc("lines", linestyle="solid", marker="o")
-    plt.rcParams["font.size"] = 12
 
     # Plot three sides of the triangle
-    draw_line(pt1, pt2)
-    draw_line(pt2, pt3)
-    draw_line(pt1, pt3)
+    draw_line(pts[0], pts[1])
+    draw_line(pts[1], pts[2])
+    draw_line(pts[0], pts[2])
 
-    annotate_angles(pt1, pt2, pt3, angle1, angle2, angle3, 0.25)
-    annotate_lengths(pt1, pt2, pt3, angle1, angle2)
+    annotate_angles(pts, angle1, angle2, angle3, angle1_rad, angle2_rad, 0.25)
+    annotate_lengths(midpoints, edge_lengths, angle1, angle2)
     # Export plot to PNG
     plt.savefig("triangle.png")
     print(
-        f"Relative side length: 1, {round(math.dist(pt2,pt3),2)}, {round(math.dist(pt1,pt3),2)}"
+        f"Relative side length: 1, {round(edge_lengths[1],2)}, {round(edge_lengths[2],2)}"
     )
 
 
@@ -92,25 +143,28 @@ def draw_line(pt1: Tuple[float, float], pt2: Tuple[float, float]) -> None:
 
 
 def annotate_angles(
-    pt1: Tuple[float, float],
-    pt2: Tuple[float, float],
-    pt3: Tuple[float, float],
+    pts: np.ndarray,
     angle1: float,
     angle2: float,
     angle3: float,
+    angle1_rad: float,
+    angle2_rad: float,
     arc_radius: float,
 ) -> None:
     """
     Annotate the angles of a triangle on a plot.
 
     Args:
-    pt1, pt2, pt3: Tuple[float, float]: The coordinates of the triangle's vertices.
+    pts: np.ndarray: The (3, 2) array of the triangle's vertex coordinates.
     angle1, angle2, angle3: float: The angles of the triangle at each vertex.
+    angle1_rad, angle2_rad: float: Angles 1 and 2 in radians, as already
+        computed by the caller.
     arc_radius: float: The radius of the arc used for the angle annotations.
 
     Returns:
     None: The angles are annotated on the current plot.
     """
+    pt1, pt2, pt3 = pts
 
     # Add angle arc for the angles
     plt.gca().add_patch(
@@ -123,13 +177,12 @@ def annotate_angles(
         Arc(pt3, arc_radius, arc_radius, angle=180 + angle1, theta1=0, theta2=angle3)
     )
 
-    # Annotate angle size on the angles
-    angle1_rad = math.radians(angle1)
-    angle2_rad = math.radians(angle2)
-
+    # Annotate angle size on the angles. cmath.rect computes the paired
+    # cos/sin offsets in one call per label instead of two.
     label_angle1 = angle1_rad / 2
-    label1_x = pt1[0] + arc_radius * math.cos(label_angle1)
-    label1_y = pt1[1] + arc_radius * math.sin(label_angle1)
+    label1_offset = cmath.rect(arc_radius, label_angle1)
+    label1_x = pt1[0] + label1_offset.real
+    label1_y = pt1[1] + label1_offset.imag
     plt.gca().text(
         label1_x,
         label1_y,
@@ -141,8 +194,9 @@ def annotate_angles(
     )
 
     label_angle2 = angle2_rad / 2
-    label2_x = pt2[0] - arc_radius * math.cos(label_angle2)
-    label2_y = pt2[1] + arc_radius * math.sin(label_angle2)
+    label2_offset = cmath.rect(arc_radius, label_angle2)
+    label2_x = pt2[0] - label2_offset.real
+    label2_y = pt2[1] + label2_offset.imag
     plt.gca().text(
         label2_x,
         label2_y,
@@ -154,8 +208,9 @@ def annotate_angles(
     )
 
     label_angle3 = ((math.pi + angle1_rad) + (math.tau - angle2_rad)) / 2
-    label3_x = pt3[0] + arc_radius * math.cos(label_angle3)
-    label3_y = pt3[1] + arc_radius * math.sin(label_angle3)
+    label3_offset = cmath.rect(arc_radius, label_angle3)
+    label3_x = pt3[0] + label3_offset.real
+    label3_y = pt3[1] + label3_offset.imag
     plt.gca().text(
         label3_x,
         label3_y,
@@ -168,9 +223,8 @@ def annotate_angles(
 
 
 def annotate_lengths(
-    pt1: Tuple[float, float],
-    pt2: Tuple[float, float],
-    pt3: Tuple[float, float],
+    midpoints: np.ndarray,
+    edge_lengths: np.ndarray,
     angle1: float,
     angle2: float,
 ) -> None:
@@ -178,22 +232,22 @@ def annotate_lengths(
     Annotate the relative lengths of the sides of a triangle on a plot.
 
     Args:
-    pt1, pt2, pt3: Tuple[float, float]: The coordinates of the triangle's vertices.
+    midpoints: np.ndarray: The (3, 2) array of edge midpoints, ordered
+        pt1-pt2, pt2-pt3, pt3-pt1.
+    edge_lengths: np.ndarray: The lengths of the edges in the same order.
     angle1, angle2: float: Two of the angles of the triangle (third angle is calculated).
 
     Returns:
     None: The side lengths are annotated on the current plot.
     """
-    midpoint12 = utilities.midpoint(pt1, pt2)
-    midpoint23 = utilities.midpoint(pt2, pt3)
-    midpoint13 = utilities.midpoint(pt1, pt3)
+    midpoint12, midpoint23, midpoint13 = midpoints
 
     plt.gca().text(midpoint12[0], midpoint12[1], "1", horizontalalignment="center")
 
     plt.gca().text(
         midpoint13[0],
         midpoint13[1],
-        f"{round(math.dist(pt1, pt3), 2)}",
+        f"{round(edge_lengths[2], 2)}",
         horizontalalignment="center",
         rotation=angle1,
     )
@@ -201,7 +255,7 @@ def annotate_lengths(
     plt.gca().text(
         midpoint23[0],
         midpoint23[1],
-        f"{round(math.dist(pt2, pt3), 2)}",
+        f"{round(edge_lengths[1], 2)}",
         horizontalalignment="center",
         rotation=360 - angle2,
     )
@@ -45,22 +45,20 @@ MORSE2NUM_DICT = {
     "-----": "0",
 }
 
-ROMAN_NUMERAL_MAP = (
-    ("M", 1000),
-    ("CM", 900),
-    ("D", 500),
-    ("CD", 400),
-    ("C", 100),
-    ("XC", 90),
-    ("L", 50),
-    ("XL", 40),
-    ("X", 10),
-    ("IX", 9),
-    ("V", 5),
-    ("IV", 4),
-    ("I", 1),
+# Translation table mapping each digit character straight to its Morse code
+# plus separator, so str.translate converts a whole number in one C-level pass.
+_NUM2MORSE_TABLE = str.maketrans(
+    {digit: code + " " for digit, code in NUM2MORSE_DICT.items()}
 )
 
+# Per-digit Roman numeral decompositions, indexed by the digit in each
+# decimal place. Looking up four of these replaces the subtract-loop over
+# symbol pairs with a constant number of operations per conversion.
+_THOUSANDS = ("", "M", "MM", "MMM")
+_HUNDREDS = ("", "C", "CC", "CCC", "CD", "D", "DC", "DCC", "DCCC", "CM")
+_TENS = ("", "X", "XX", "XXX", "XL", "L", "LX", "LXX", "LXXX", "XC")
+_UNITS = ("", "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX")
+
 
 def num2morse(num: int) -> str:
     """
@@ -72,10 +70,7 @@ def num2morse(num: int) -> str:
     Returns:
         str: Morse code representation of the number.
     """
-    cipher = ""
-    for digit in str(num):
-        cipher += NUM2MORSE_DICT[digit] + " "
-    return cipher.strip()  # Remove trailing space
+    return str(num).translate(_NUM2MORSE_TABLE)[:-1]  # Drop trailing separator
 
 
 def morse2num(morse: str) -> int:
@@ -88,11 +83,7 @@ def morse2num(morse: str) -> int:
     Returns:
         int: The integer representation of the Morse code.
     """
-    processed_morses = morse.split()
-    decipher = ""
-    for processed_morse in processed_morses:
-        decipher += MORSE2NUM_DICT[processed_morse]
-    return int(decipher)
+    return int("".join(MORSE2NUM_DICT[code] for code in morse.split()))
 
 
 def num2roman(num: int) -> str:
@@ -108,28 +99,32 @@ def num2roman(num: int) -> str:
     if num == 0:
         return "N"  # Use 'N' for zero in Roman numerals
 
-    roman_num = ""
-    for numeral, integer in ROMAN_NUMERAL_MAP:
-        while num >= integer:
-            roman_num += numeral
-            num -= integer
-    return roman_num
+    return (
+        _THOUSANDS[num // 1000]
+        + _HUNDREDS[num // 100 % 10]
+        + _TENS[num // 10 % 10]
+        + _UNITS[num % 10]
+    )
+
+
+# Cached (ordinal, formatted string) pair for roman_date(); the formatted
+# date only changes at midnight so recomputing it per log line is wasted work.
+_ROMAN_DATE_CACHE: Tuple[int, str] = (0, "")
 
 
 def roman_date() -> str:
     """Return current timestamp in Roman numerals in the format of D.M.Y"""
+    global _ROMAN_DATE_CACHE
 
-    # Get day, month and year in numerical form
-    today_day = date.today().day
-    today_month = date.today().month
-    today_year = date.today().year
-
-    # Convert day, month and year from numerical form to roman numeral form
-    roman_day = num2roman(today_day)
-    roman_month = num2roman(today_month)
-    roman_year = num2roman(today_year)
+    today = date.today()
+    ordinal = today.toordinal()
+    cached_ordinal, cached_date = _ROMAN_DATE_CACHE
+    if cached_ordinal == ordinal:
+        return cached_date
 
-    return f"{roman_day}.{roman_month}.{roman_year}"
+    roman = f"{num2roman(today.day)}.{num2roman(today.month)}.{num2roman(today.year)}"
+    _ROMAN_DATE_CACHE = (ordinal, roman)
+    return roman
 
 
 def dec2sex(deci: float) -> Tuple[float, float, float]: